@@ -4,9 +4,21 @@
 本模块以教学示范的方式实现万智牌官网《斯翠海文》故事的定向抓取。
 需求核心：
 1. 固定抓取 10 篇英文故事，并在页面存在简体中文版时同步抓取；
-2. 利用 `trafilatura` 提取 Markdown 正文，确保文本结构清晰；
+2. 优先利用 `resiliparse` 提取正文（单核速度约为 trafilatura 的 8 倍），
+   缺失时回退到 `trafilatura` 输出 Markdown，确保文本结构清晰；
 3. 下载正文中引用的所有图片到本地 `assets` 目录，Markdown 中改写为相对路径；
-4. 将抓取过程拆分为可复用的函数与类，边界处理独立封装，配合详尽中文注释帮助初学者理解。
+4. 将抓取过程拆分为可复用的函数与类，边界处理独立封装，配合详尽中文注释帮助初学者理解；
+5. 基于 `asyncio` + `httpx.AsyncClient` 并发抓取，总耗时从"逐篇累加"降为"约等于最慢一篇"。
+
+依赖安装（h2 启用 HTTP/2 多路复用，brotli 让 httpx 自动协商 br 压缩）：
+    pip install "httpx[http2,brotli]" lxml resiliparse trafilatura lxml_html_clean
+
+可选加速（均在运行时自动探测，无需改代码）：
+    pip install faust-cchardet "htmldate[speed]" orjson    # Python < 3.11 可改装 cchardet
+    - lxml 5.2 起拆出了 lxml_html_clean，缺少它时 trafilatura 无法导入，会静默降级；
+    - cchardet 用 C 实现编码探测，页面未声明 charset 时替代纯 Python 的探测；
+    - htmldate[speed] 加速 trafilatura 的日期解析（本脚本已关闭深度日期搜索）；
+    - orjson 替代标准库解析 JSON-LD 元信息。
 
 运行示例：
     python wotc_story_scraper.py --sleep 1.2
@@ -14,26 +26,42 @@
 输出目录结构：
     scripts/万智牌官方小故事爬虫/output/<slug>/<语言代码>.md
     scripts/万智牌官方小故事爬虫/assets/<slug>/<编号_图片描述>.jpg
+    scripts/万智牌官方小故事爬虫/assets/_manifest.json（图片下载记录，重复运行时按 ETag 验证）
 
 注意事项：
     - 默认以英文站点为基础，当检测到 zh-Hans 页面可用时才会额外抓取；
     - 如遇请求失败或限速，脚本会记录错误并继续后续任务；
+    - 全局并发由信号量限制，`--sleep` 仅约束同一站点相邻页面请求的间隔；
     - 可通过 CLI 参数调整请求间隔与输出路径。
 """
 
 from __future__ import annotations
 
 import argparse
+import asyncio
+import codecs
+import copy
+import hashlib
+import io
+import itertools
 import json
 import os
+import random
 import re
-import time
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Dict, Iterable, List, Mapping, Optional, Set, Tuple
 from urllib.parse import urljoin, urlparse
 
 import httpx
+from lxml import etree
 from lxml import html as lxml_html
 
 # ---- 第三方正文提取：优先使用 trafilatura，若缺失则降级为 markdownify ----
@@ -45,6 +73,38 @@ except Exception:  # pragma: no cover - 降级分支主要用于教学演示
     HAVE_TRAF = False
     from markdownify import markdownify as md  # type: ignore
 
+# ---- 更快的正文提取：resiliparse（Rust/C++ 实现），缺失时仅使用上面的分支 ----
+try:  # pragma: no cover - 依赖是否安装取决于运行环境
+    from resiliparse.extract.html2text import extract_plain_text  # type: ignore
+
+    HAVE_RESILIPARSE = True
+except Exception:  # pragma: no cover
+    HAVE_RESILIPARSE = False
+
+# ---- 编码探测：cchardet（faust-cchardet 同名模块）比纯 Python 实现快一个数量级 ----
+try:  # pragma: no cover - 依赖是否安装取决于运行环境
+    import cchardet  # type: ignore
+
+    HAVE_CCHARDET = True
+except Exception:  # pragma: no cover
+    HAVE_CCHARDET = False
+
+# ---- JSON 解析：orjson 为 C 扩展，解析 JSON-LD 比标准库快 2~3 倍 ----
+try:  # pragma: no cover - 依赖是否安装取决于运行环境
+    import orjson  # type: ignore
+
+    HAVE_ORJSON = True
+except Exception:  # pragma: no cover
+    HAVE_ORJSON = False
+
+# ---- HTTP/2 需要可选依赖 h2；缺失时退回 HTTP/1.1 keep-alive ----
+try:  # pragma: no cover - 依赖是否安装取决于运行环境
+    import h2  # type: ignore  # noqa: F401
+
+    HAVE_H2 = True
+except Exception:  # pragma: no cover
+    HAVE_H2 = False
+
 
 # ===============================
 # 常量与基础数据
@@ -72,8 +132,70 @@ BASE_HEADERS: Dict[str, str] = {
     )
 }
 
-# 用于识别图片 Markdown 的正则表达式
-MD_IMAGE_PATTERN = re.compile(r"!\[(?P<alt>[^\]]*)\]\((?P<src>[^)]+)\)")
+# 全局并发上限：同一时刻最多允许多少个请求在途
+MAX_CONCURRENT_REQUESTS = 8
+
+# 单站点并发上限：避免对图片 CDN 等单一主机同时发起过多请求
+MAX_REQUESTS_PER_HOST = 6
+
+# 站点限速信号：收到这些状态码时只对该站点做指数退避，其他站点照常请求
+THROTTLE_STATUS_CODES = frozenset({429, 503})
+MAX_BACKOFF_SECONDS = 60.0
+
+# 失败重试的随机抖动上限，避免多个协程在同一时刻集中重试
+RETRY_JITTER_SECONDS = 0.5
+
+# 正文解析/提取线程数：lxml 与 resiliparse 在 C 层释放 GIL，线程池即可并行
+MAX_EXTRACT_WORKERS = min(8, os.cpu_count() or 1)
+
+# 连接池配置：整个运行期间只创建一个客户端，所有页面与图片请求复用同一批
+# TCP/TLS 连接（文章站点 + 图片 CDN 两个主机，正适合 keep-alive 复用）
+CLIENT_LIMITS = httpx.Limits(
+    max_keepalive_connections=16,
+    max_connections=32,
+    keepalive_expiry=30.0,
+)
+CLIENT_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+
+# 预热连接的目标：只预热图片 CDN，在首个图片请求前先完成 DNS/TCP/TLS 握手。
+# 文章站点的首个 GET 与预热同时发出，HTTP/1.1 下无法复用预热连接，反而多占一次限速额度
+WARMUP_URLS: Tuple[str, ...] = ("https://media.wizards.com/",)
+WARMUP_TIMEOUT = httpx.Timeout(5.0)
+
+# 正文提取引擎：按偏好排序，首选不可用或结果为空时依次回退
+EXTRACTORS: Tuple[str, ...] = ("resiliparse", "trafilatura")
+
+# 落盘参数：下载每次从网络读取 64 KiB，写文件统一用 1 MiB 缓冲合并小块写入
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# 图片资源清单文件名（位于 assets 根目录），跨运行复用下载结果
+MANIFEST_NAME = "_manifest.json"
+
+# JSON-LD 中承载文章元信息的节点类型
+ARTICLE_LD_TYPES = frozenset({"Article", "NewsArticle"})
+
+# 简体中文页面可能使用的 hreflang（按优先级排列）
+ZH_HREFLANGS: Tuple[str, ...] = ("zh", "zh-cn", "zh-hans")
+
+# HTTP Link 响应头解析：<目标地址>; rel="alternate"; hreflang="zh-Hans"
+LINK_HEADER_PATTERN = re.compile(r"<(?P<href>[^>]*)>(?P<params>[^,<]*)")
+LINK_PARAM_PATTERN = re.compile(r';\s*(?P<key>[\w-]+)\s*=\s*"?(?P<value>[^";]*)"?')
+
+# 头部扫描时每次喂给增量解析器的字符数
+HEAD_SCAN_CHUNK = 16 * 1024
+
+# 预编译 XPath：模块加载时编译一次，每篇文章、每种语言直接复用
+XPATH_JSONLD = etree.XPath('//script[@type="application/ld+json"]/text()')
+XPATH_ALTERNATE = etree.XPath('//link[@rel="alternate"][@hreflang]')
+XPATH_ARTICLE_IMGS = etree.XPath("//article//img | //main//img")
+XPATH_ALL_IMGS = etree.XPath("//img")
+XPATH_MAIN = etree.XPath('//article | //main | //*[@data-component="Article"]')
+XPATH_H1_TEXT = etree.XPath("string(//h1)")
+# 带参数的表达式：调用时以关键字传入 $name，例如 XPATH_TESTID_TEXT(tree, name="byline-name")
+XPATH_TESTID_TEXT = etree.XPath("string(//*[@data-testid=$name])")
+XPATH_META_NAME = etree.XPath("string(//meta[@name=$name]/@content)")
+XPATH_META_PROPERTY = etree.XPath("string(//meta[@property=$name]/@content)")
 
 
 # ===============================
@@ -102,11 +224,130 @@ class DownloadResult:
     warnings: List[str]
 
 
+# ===============================
+# 并发与限速控制
+# ===============================
+
+
+class RequestGate:
+    """统一约束请求并发：全局与单站点信号量限制在途数量，按站点节流与退避。"""
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        interval_seconds: float,
+        max_per_host: int = MAX_REQUESTS_PER_HOST,
+    ) -> None:
+        self.interval_seconds = interval_seconds
+        self.max_per_host = max_per_host
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._host_locks: Dict[str, asyncio.Lock] = {}
+        self._next_slot: Dict[str, float] = {}
+        # 站点被限速后的暂停截止时间与连续被限速次数
+        self._blocked_until: Dict[str, float] = {}
+        self._strikes: Dict[str, int] = {}
+
+    def backoff(self, url: str, retry_after: Optional[float] = None) -> float:
+        """站点返回 429/503 时调用：只暂停该站点，返回暂停秒数。
+
+        服务器给出 Retry-After 时照办，否则按连续被限速次数指数退避；两者都不超过
+        MAX_BACKOFF_SECONDS，避免一个过长的 Retry-After 拖住整轮抓取。
+        """
+
+        host = urlparse(url).netloc
+        strikes = self._strikes[host] = self._strikes.get(host, 0) + 1
+        if retry_after is not None:
+            delay = min(MAX_BACKOFF_SECONDS, retry_after)
+        else:
+            delay = min(MAX_BACKOFF_SECONDS, max(self.interval_seconds, 1.0) * 2 ** (strikes - 1))
+        resume_at = asyncio.get_running_loop().time() + delay
+        self._blocked_until[host] = max(self._blocked_until.get(host, 0.0), resume_at)
+        return delay
+
+    def recover(self, url: str) -> None:
+        """站点请求成功后清零退避计数。"""
+
+        self._strikes.pop(urlparse(url).netloc, None)
+
+    async def _wait_backoff(self, host: str) -> None:
+        """若站点处于退避期则等待；等待期间退避可能被延长，因此循环检查。"""
+
+        loop = asyncio.get_running_loop()
+        while True:
+            delay = self._blocked_until.get(host, 0.0) - loop.time()
+            if delay <= 0:
+                return
+            await asyncio.sleep(delay)
+
+    async def _throttle(self, host: str) -> None:
+        """保证同一站点相邻两次请求至少间隔 interval_seconds，不同站点互不阻塞。"""
+
+        lock = self._host_locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            loop = asyncio.get_running_loop()
+            delay = self._next_slot.get(host, 0.0) - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_slot[host] = loop.time() + self.interval_seconds
+
+    @asynccontextmanager
+    async def slot(self, url: str, throttle: bool = True) -> AsyncIterator[None]:
+        """占用一个请求名额；throttle=False 时跳过站点节流（如图片 CDN），但仍遵守退避。"""
+
+        host = urlparse(url).netloc
+        await self._wait_backoff(host)
+        if throttle:
+            await self._throttle(host)
+        host_semaphore = self._host_semaphores.setdefault(
+            host, asyncio.Semaphore(self.max_per_host)
+        )
+        # 先占单站点名额再占全局名额，避免排队等某个站点时白占全局名额
+        async with host_semaphore, self._semaphore:
+            yield
+
+
 # ===============================
 # 基础工具函数
 # ===============================
 
 
+def detect_encoding(content: bytes) -> str:
+    """响应头未声明 charset 时由 httpx 回调，探测正文编码；缺少 cchardet 时按 UTF-8 处理。
+
+    cchardet 可能返回 Python 没有对应编解码器的名称（如 EUC-TW），httpx 不做校验，
+    直接使用会在读取 response.text 时抛出 LookupError，因此先用 codecs.lookup 验证。
+    """
+
+    if HAVE_CCHARDET:
+        encoding = cchardet.detect(content).get("encoding")
+        if encoding:
+            try:
+                codecs.lookup(encoding)
+            except LookupError:
+                return "utf-8"
+            return encoding
+    return "utf-8"
+
+
+def build_client() -> httpx.AsyncClient:
+    """创建全局共享的异步客户端：统一请求头、超时与连接池。
+
+    Accept-Encoding 交由 httpx 按已安装的解码器自动声明（gzip/deflate，装了
+    brotli 时追加 br），避免声明了无法解码的编码。页面在这里就解码为 str，
+    后续提取直接使用节点树，trafilatura 不会再走自身的编码探测。
+    """
+
+    return httpx.AsyncClient(
+        http2=HAVE_H2,
+        follow_redirects=True,
+        limits=CLIENT_LIMITS,
+        headers=BASE_HEADERS,
+        timeout=CLIENT_TIMEOUT,
+        default_encoding=detect_encoding,
+    )
+
+
 def sanitize_filename(name: str, fallback: str = "untitled") -> str:
     """将标题/描述转换为安全的文件名片段，避免跨平台非法字符。"""
 
@@ -122,34 +363,89 @@ def derive_slug(source_url: str) -> str:
     return sanitize_filename(slug)
 
 
-def build_headers(language_code: str) -> Dict[str, str]:
-    """根据语言代码生成请求头，帮助服务器返回期望语言版本。"""
+async def warm_up_connections(
+    client: httpx.AsyncClient,
+    urls: Iterable[str] = WARMUP_URLS,
+) -> None:
+    """向各主机并发发送 HEAD，让连接池提前建立好连接。
+
+    预热不经过 RequestGate，目标仅限不参与节流的图片 CDN。
+    只需完成握手，因此不跟随重定向；失败一律忽略，正式请求会照常自行建连。
+    """
+
+    await asyncio.gather(
+        *(
+            client.head(url, timeout=WARMUP_TIMEOUT, follow_redirects=False)
+            for url in urls
+        ),
+        return_exceptions=True,
+    )
+
+
+@lru_cache(maxsize=8)
+def build_headers(language_code: str) -> Mapping[str, str]:
+    """根据语言代码生成请求头，帮助服务器返回期望语言版本。
 
-    headers = dict(BASE_HEADERS)
+    只包含按语言变化的字段，通用请求头由客户端默认值合并；结果按语言缓存，
+    以只读映射返回，防止调用方修改缓存条目。
+    """
+
+    headers: Dict[str, str] = {}
     # Accept-Language 需要兼顾首选语言与英文备选，避免 406
     if language_code.lower().startswith("zh"):
         headers["Accept-Language"] = "zh-CN,zh;q=0.9,en;q=0.6"
     else:
         headers["Accept-Language"] = "en-US,en;q=0.8"
-    return headers
+    return MappingProxyType(headers)
+
 
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """解析 Retry-After 响应头：支持秒数与 HTTP 日期两种格式，无法解析时返回 None。"""
 
-def fetch_html(
-    client: httpx.Client,
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+async def fetch_html(
+    client: httpx.AsyncClient,
+    gate: RequestGate,
     url: str,
     language_code: str,
     max_retries: int = 3,
     sleep_seconds: float = 1.0,
-) -> Tuple[Optional[str], List[str]]:
-    """带简单重试的 HTML 抓取，返回页面文本与告警列表。"""
+) -> Tuple[Optional[httpx.Response], List[str]]:
+    """带指数退避重试的 HTML 抓取，返回成功的响应（失败为 None）与告警列表。
+
+    返回整个响应而非仅正文，调用方可顺带读取 Link 等响应头。成功时立即返回，
+    只有失败后才等待：限速响应交给 RequestGate 按站点暂停（遵守 Retry-After），
+    其余失败按 sleep_seconds * 2^(n-1) 加随机抖动退避，最后一次失败不再等待。
+    """
 
     warnings: List[str] = []
     headers = build_headers(language_code)
     for attempt in range(1, max_retries + 1):
+        throttled = False
         try:
-            response = client.get(url, headers=headers, follow_redirects=True, timeout=30)
+            async with gate.slot(url):
+                response = await client.get(url, headers=headers)
             if response.status_code == 200 and response.text:
-                return response.text, warnings
+                gate.recover(url)
+                return response, warnings
+            if response.status_code in THROTTLE_STATUS_CODES:
+                throttled = True
+                retry_after = parse_retry_after(response.headers.get("retry-after"))
+                delay = gate.backoff(url, retry_after)
+                warnings.append(f"站点限速，暂停该站点 {delay:.1f}s：{url}")
             warnings.append(
                 f"HTTP {response.status_code}：{url} (尝试 {attempt}/{max_retries})"
             )
@@ -157,7 +453,10 @@ def fetch_html(
             warnings.append(
                 f"请求异常：{exc} (尝试 {attempt}/{max_retries})"
             )
-        time.sleep(sleep_seconds)
+        # 限速时下一次 gate.slot 会自行等到站点恢复，这里无需重复等待
+        if attempt < max_retries and not throttled:
+            delay = min(MAX_BACKOFF_SECONDS, sleep_seconds * 2 ** (attempt - 1))
+            await asyncio.sleep(delay + random.uniform(0, RETRY_JITTER_SECONDS))
     return None, warnings
 
 
@@ -167,43 +466,86 @@ def parse_html_tree(html_text: str) -> lxml_html.HtmlElement:
     return lxml_html.fromstring(html_text)
 
 
+def parse_head(html_text: str) -> lxml_html.HtmlElement:
+    """增量解析页面开头，读完 </head> 即停止，返回只含头部的节点树。
+
+    多语言 <link rel="alternate"> 都位于 <head> 内，无需为整页构建 DOM。
+    """
+
+    parser = etree.HTMLPullParser(events=("end",), tag="head")
+    parser.set_element_class_lookup(lxml_html.HtmlElementClassLookup())
+    for offset in range(0, len(html_text), HEAD_SCAN_CHUNK):
+        parser.feed(html_text[offset : offset + HEAD_SCAN_CHUNK])
+        if any(True for _ in parser.read_events()):
+            break
+    return parser.close()
+
+
+def decode_jsonld_articles(raw: str) -> Tuple[dict, ...]:
+    """解析单段 JSON-LD，只保留 Article 类节点。"""
+
+    try:
+        data = orjson.loads(raw) if HAVE_ORJSON else json.loads(raw)
+    except ValueError:  # json 与 orjson 的解析异常均继承自 ValueError
+        return ()
+    if isinstance(data, dict):
+        data = [data]
+    if not isinstance(data, list):
+        return ()
+    articles = []
+    for item in data:
+        if not isinstance(item, dict):
+            continue
+        # @type 可能是字符串，也可能是类型列表；非字符串成员一律忽略
+        types = item.get("@type")
+        if not isinstance(types, list):
+            types = [types]
+        types = {t for t in types if isinstance(t, str)}
+        if types & ARTICLE_LD_TYPES:
+            articles.append(item)
+    return tuple(articles)
+
+
 def extract_article_meta(tree: lxml_html.HtmlElement, language_code: str, source_url: str) -> ArticleMeta:
-    """从 JSON-LD 脚本中提取标题、作者与发布时间。"""
+    """提取标题、作者与发布时间。
+
+    标题与作者以 JSON-LD 为准（og:title 常带站点后缀，通用 author 可能是站点名），
+    发布时间优先读 article:published_time；JSON-LD 惰性逐段解码，凑齐即停止。
+    """
 
     title = ""
     author = ""
-    published = ""
-    for node in tree.xpath('//script[@type="application/ld+json"]/text()'):
-        try:
-            data = json.loads(node)
-        except json.JSONDecodeError:
-            continue
-        if isinstance(data, list):
-            candidates: Iterable[dict] = [item for item in data if isinstance(item, dict)]
-        elif isinstance(data, dict):
-            candidates = [data]
-        else:
-            continue
-        for item in candidates:
-            if item.get("@type") not in {"Article", "NewsArticle"}:
-                continue
-            title = item.get("headline") or title
-            published = item.get("datePublished") or published
+    published = XPATH_META_PROPERTY(tree, name="article:published_time").strip()
+    # 惰性逐段解码：三项信息凑齐后立即停止，后续脚本块不再 loads。
+    # article:* 标签不含标题，因此 JSON-LD 至少要解码到拿到 headline 为止。
+    # XPath 文本结果是持有节点引用的 str 子类，orjson 只接受普通 str
+    articles = itertools.chain.from_iterable(
+        decode_jsonld_articles(str(node)) for node in XPATH_JSONLD(tree)
+    )
+    for item in articles:
+        title = title or item.get("headline") or ""
+        published = published or item.get("datePublished") or ""
+        if not author:
             author_data = item.get("author")
             if isinstance(author_data, list):
                 names = [a.get("name") for a in author_data if isinstance(a, dict)]
-                author = ", ".join(filter(None, names)) or author
+                author = ", ".join(filter(None, names))
             elif isinstance(author_data, dict):
-                author = author_data.get("name", author)
-    # 兜底：若 JSON-LD 缺失，回退到 <h1> 与页面辅助信息
+                author = author_data.get("name", "")
+        if title and author and published:
+            break
+    # JSON-LD 缺失时先用 <meta> 补齐标题与作者
+    if not title:
+        title = XPATH_META_PROPERTY(tree, name="og:title").strip()
+    if not author:
+        author = XPATH_META_NAME(tree, name="author").strip()
+    # 兜底：若 JSON-LD 与 <meta> 均缺失，回退到 <h1> 与页面辅助信息
     if not title:
-        title = (tree.xpath("string(//h1)") or "").strip()
+        title = XPATH_H1_TEXT(tree).strip()
     if not author:
-        author = (tree.xpath('string(//*[@data-testid="byline-name"])') or "").strip()
+        author = XPATH_TESTID_TEXT(tree, name="byline-name").strip()
     if not published:
-        published = (
-            tree.xpath('string(//*[@data-testid="publish-date"])') or ""
-        ).strip()
+        published = XPATH_TESTID_TEXT(tree, name="publish-date").strip()
     return ArticleMeta(
         title=title or "未命名文章",
         author=author or "未知作者",
@@ -213,39 +555,121 @@ def extract_article_meta(tree: lxml_html.HtmlElement, language_code: str, source
     )
 
 
+def extract_link_header_variants(
+    headers: httpx.Headers,
+    base_url: str,
+) -> Dict[str, str]:
+    """解析响应头 Link 中 rel=alternate 的多语言链接，无需解析 HTML。"""
+
+    variants: Dict[str, str] = {}
+    for match in LINK_HEADER_PATTERN.finditer(",".join(headers.get_list("link"))):
+        params = {
+            item.group("key").lower(): item.group("value").strip()
+            for item in LINK_PARAM_PATTERN.finditer(match.group("params"))
+        }
+        href = match.group("href").strip()
+        lang = params.get("hreflang", "")
+        if "alternate" not in params.get("rel", "").lower().split() or not lang or not href:
+            continue
+        variants[lang.lower()] = urljoin(base_url, href)
+    return variants
+
+
 def extract_language_variants(
     tree: lxml_html.HtmlElement,
     base_url: str,
+    stop_at: Iterable[str] = (),
 ) -> Dict[str, str]:
-    """解析 <link rel="alternate"> 列表，构建语言代码到 URL 的映射。"""
+    """解析 <link rel="alternate"> 列表，构建语言代码到 URL 的映射。
+
+    stop_at 中任一语言出现后立即返回，不再遍历剩余链接。
+    """
 
+    wanted = set(stop_at)
     variants: Dict[str, str] = {}
-    for link in tree.xpath('//link[@rel="alternate"][@hreflang]'):
+    for link in XPATH_ALTERNATE(tree):
         lang = link.get("hreflang", "").strip()
         href = link.get("href", "").strip()
         if not lang or not href:
             continue
         variants[lang.lower()] = urljoin(base_url, href)
+        if lang.lower() in wanted:
+            break
     return variants
 
 
-def html_to_markdown(html_text: str, source_url: str) -> str:
-    """将整页 HTML 转换为 Markdown，用于写入最终文件。"""
+def _extract_with_resiliparse(tree: lxml_html.HtmlElement) -> Optional[str]:
+    """resiliparse 只输出纯文本，因此先把 <img> 替换为 Markdown 图片占位再提取。"""
 
-    if HAVE_TRAF:
-        result = trafilatura.extract(  # type: ignore[arg-type]
-            html_text,
-            include_links=True,
-            include_formatting=True,
-            output_format="markdown",
-            url=source_url,
-        )
+    if not HAVE_RESILIPARSE:
+        return None
+    # 占位替换会修改节点树，复制一份以免影响调用方后续的图片收集
+    tree = copy.deepcopy(tree)
+    for img in XPATH_ALL_IMGS(tree):
+        src = img.get("src") or ""
+        parent = img.getparent()
+        if not src or parent is None:
+            img.drop_tree()
+            continue
+        # 用独立段落承载占位文本，提取后图片自成一行
+        token = lxml_html.Element("p")
+        token.text = f"![{(img.get('alt') or '').strip()}]({src})"
+        token.tail = img.tail
+        parent.replace(img, token)
+    result = extract_plain_text(
+        lxml_html.tostring(tree, encoding="unicode"),
+        main_content=True,
+        preserve_formatting=True,
+        links=False,
+    )
+    return result or None
+
+
+def _extract_with_trafilatura(tree: lxml_html.HtmlElement) -> Optional[str]:
+    """trafilatura 保真度更高；关闭回退算法、评论与日期深度搜索以避开慢路径。"""
+
+    if not HAVE_TRAF:
+        return None
+    # 直接传入已解析的节点树：trafilatura 会自行复制，不再重复解析 HTML。
+    # 不传 url：链接已由 localize_images 转为绝对地址，传入反而会把本地图片
+    # 相对路径错误地拼接成站点 URL
+    return trafilatura.extract(  # type: ignore[arg-type]
+        tree,
+        include_links=True,
+        include_images=True,
+        include_formatting=True,
+        output_format="markdown",
+        fast=True,
+        with_metadata=False,
+        include_comments=False,
+        deduplicate=False,
+        # 元信息已从 JSON-LD 读取，无需 htmldate 的全文日期搜索
+        date_extraction_params={"extensive_search": False},
+    )
+
+
+def html_to_markdown(
+    tree: lxml_html.HtmlElement,
+    extractor: str = EXTRACTORS[0],
+) -> str:
+    """将已解析的页面节点树转换为 Markdown，用于写入最终文件。
+
+    节点树中的链接与图片地址按原样输出，调用前应先经过 localize_images 处理。
+    extractor 指定首选引擎，其余引擎作为回退；全部不可用时走 markdownify。
+    """
+
+    engines = {
+        "resiliparse": _extract_with_resiliparse,
+        "trafilatura": _extract_with_trafilatura,
+    }
+    order = [extractor] + [name for name in EXTRACTORS if name != extractor]
+    for name in order:
+        result = engines[name](tree)
         if result:
             return result
 
-    # 降级：使用 lxml 选出主体标签，再走 markdownify
-    tree = parse_html_tree(html_text)
-    node = tree.xpath('//article | //main | //*[@data-component="Article"]')
+    # 降级：复用同一棵节点树选出主体标签，再走 markdownify
+    node = XPATH_MAIN(tree)
     html_fragment = "".join(
         lxml_html.tostring(item, encoding="unicode") for item in (node or [tree])
     )
@@ -259,7 +683,7 @@ def collect_images(
     """提取文章主体中的图片 URL 与 alt 文本。"""
 
     results: List[Tuple[str, str]] = []
-    for img in tree.xpath('//article//img | //main//img'):
+    for img in XPATH_ARTICLE_IMGS(tree):
         src = img.get("src") or img.get("data-src") or ""
         if not src:
             continue
@@ -269,19 +693,25 @@ def collect_images(
     return results
 
 
-def rewrite_markdown_images(
-    markdown_text: str,
+def localize_images(
+    tree: lxml_html.HtmlElement,
+    base_url: str,
     replacement_map: Dict[str, str],
-) -> str:
-    """将 Markdown 中的远程图片 URL 替换为本地相对路径。"""
+) -> None:
+    """在节点树上直接改写图片地址，使提取出的 Markdown 天然引用本地文件。
 
-    def _replace(match: re.Match[str]) -> str:
-        src = match.group("src")
-        alt = match.group("alt")
-        new_src = replacement_map.get(src, src)
-        return f"![{alt}]({new_src})"
+    先把所有链接转为绝对地址，再把已下载图片的 src 换成本地相对路径；
+    懒加载的 data-src 一并归并到 src，免去提取后再用正则扫描全文替换。
+    """
 
-    return MD_IMAGE_PATTERN.sub(_replace, markdown_text)
+    tree.make_links_absolute(base_url, handle_failures="ignore")
+    for img in XPATH_ALL_IMGS(tree):
+        src = img.get("src") or img.get("data-src") or ""
+        img.attrib.pop("data-src", None)
+        if not src:
+            continue
+        full_url = urljoin(base_url, src)
+        img.set("src", replacement_map.get(full_url, full_url))
 
 
 # ===============================
@@ -289,26 +719,152 @@ def rewrite_markdown_images(
 # ===============================
 
 
+def expected_body_size(resp: httpx.Response) -> Optional[int]:
+    """读取 Content-Length；响应经过压缩时该值不等于解码后的大小，返回 None。"""
+
+    if resp.headers.get("content-encoding", "identity") != "identity":
+        return None
+    try:
+        size = int(resp.headers.get("content-length", ""))
+    except ValueError:
+        return None
+    return size if size > 0 else None
+
+
+async def write_stream_to_file(resp: httpx.Response, target: Path) -> Tuple[int, str]:
+    """把流式响应写入文件：已知大小时预分配空间，大块缓冲减少 write() 次数。
+
+    返回实际写入的字节数与 SHA-256 摘要，供资源清单记录。
+    """
+
+    size = expected_body_size(resp)
+    digest = hashlib.sha256()
+    written = 0
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(target, flags, 0o644)
+    with io.open(fd, "wb", buffering=WRITE_BUFFER_SIZE) as fh:
+        if size is not None:
+            # 一次性预留整块空间，避免边写边扩展造成碎片
+            try:
+                os.posix_fallocate(fd, 0, size)  # type: ignore[attr-defined]
+            except (AttributeError, OSError):
+                fh.truncate(size)
+        async for chunk in resp.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+            fh.write(chunk)
+            digest.update(chunk)
+            written += len(chunk)
+        # 实际长度可能与声明不符，截掉多余的预分配部分
+        fh.truncate()
+    return written, digest.hexdigest()
+
+
+def link_or_copy(source: Path, target: Path) -> None:
+    """让 target 与 source 内容一致：优先硬链接，经临时文件原子替换已有文件。"""
+
+    partial = target.with_name(target.name + ".part")
+    partial.unlink(missing_ok=True)
+    try:
+        os.link(source, partial)
+    except OSError:
+        # 不支持硬链接的文件系统（如部分 Windows 挂载）退回普通复制
+        shutil.copyfile(source, partial)
+    os.replace(partial, target)
+
+
 class AssetManager:
-    """统一管理图片落盘，避免重复下载并生成相对路径。"""
+    """统一管理图片落盘：按 URL 全局去重，各 slug 目录通过硬链接共享同一文件。
+
+    下载记录持久化在 assets/_manifest.json 中（URL -> 路径、ETag、Last-Modified、
+    大小、SHA-256 及各 slug 的链接位置），再次运行时用条件请求验证，未变化的
+    图片只需一次 304 往返。
+    """
 
     def __init__(self, base_dir: Path) -> None:
         self.base_dir = base_dir
-        self.cache: Dict[str, Dict[str, Path]] = {}
+        self.manifest_path = base_dir / MANIFEST_NAME
+        self.manifest: Dict[str, Dict[str, Any]] = self._load_manifest()
+        # slug -> (远程 URL -> 该 slug 目录下的本地文件)，保证每篇文章目录自成一体
+        self.mirrors: Dict[str, Dict[str, Path]] = {}
+        # 在途下载任务：并发场景下同一 URL 只发起一次请求，其余调用者等待同一任务
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # 已预留的文件名：选名与预留之间没有 await，因此在事件循环内是原子的
+        self._reserved: Set[Path] = set()
+        # 本次运行内容有更新（非 304）的 URL：其他 slug 下的旧链接需要重新链接
+        self._refreshed: Set[str] = set()
+
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """读取上次运行留下的资源清单；缺失或损坏时视为空清单。"""
 
-    def ensure_download(
+        try:
+            data = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def save_manifest(self) -> None:
+        """原子写回资源清单，路径均相对 assets 根目录，便于整体搬移。"""
+
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+        partial = self.manifest_path.with_name(MANIFEST_NAME + ".part")
+        partial.write_text(
+            json.dumps(self.manifest, ensure_ascii=False, indent=2, sort_keys=True),
+            encoding="utf-8",
+        )
+        os.replace(partial, self.manifest_path)
+
+    async def ensure_download(
         self,
-        client: httpx.Client,
+        client: httpx.AsyncClient,
+        gate: RequestGate,
         slug: str,
         remote_url: str,
         alt_text: str,
         index: int,
     ) -> Tuple[Optional[Path], Optional[str]]:
-        """下载图片并返回文件路径；若已缓存则直接复用。"""
+        """返回图片在 slug 目录下的本地路径；已下载过的 URL 只做本地链接。"""
 
-        slug_cache = self.cache.setdefault(slug, {})
-        if remote_url in slug_cache:
-            return slug_cache[remote_url], None
+        slug_mirrors = self.mirrors.setdefault(slug, {})
+        if remote_url in slug_mirrors:
+            return slug_mirrors[remote_url], None
+
+        task = self._inflight.get(remote_url)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._download(client, gate, slug, remote_url, alt_text, index)
+            )
+            task.add_done_callback(lambda done: self._forget_failed(remote_url, done))
+            self._inflight[remote_url] = task
+        source, warning = await task
+        if source is None:
+            return None, warning
+
+        # 等待期间可能已有同 slug 的调用者完成链接，再检查一次
+        if remote_url in slug_mirrors:
+            return slug_mirrors[remote_url], None
+        if source.parent == self.base_dir / slug:
+            slug_mirrors[remote_url] = source
+            return source, None
+
+        # 沿用上次运行的链接位置；内容未更新且文件仍在时无需任何磁盘操作
+        links = self.manifest[remote_url].setdefault("mirrors", {})
+        target = self.base_dir / links[slug] if slug in links else None
+        if target is None or not target.is_file() or remote_url in self._refreshed:
+            if target is None:
+                target = self._reserve_path(slug, remote_url, alt_text, index)
+            link_or_copy(source, target)
+            links[slug] = target.relative_to(self.base_dir).as_posix()
+        slug_mirrors[remote_url] = target
+        return target, None
+
+    def _forget_failed(self, remote_url: str, task: asyncio.Task) -> None:
+        """下载失败的任务移出在途表：只缓存成功结果，之后的调用者会重新下载。"""
+
+        if task.cancelled() or task.exception() is not None or task.result()[0] is None:
+            if self._inflight.get(remote_url) is task:
+                del self._inflight[remote_url]
+
+    def _reserve_path(self, slug: str, remote_url: str, alt_text: str, index: int) -> Path:
+        """为图片挑选一个未被占用的本地文件名并立即预留。"""
 
         slug_dir = self.base_dir / slug
         slug_dir.mkdir(parents=True, exist_ok=True)
@@ -318,20 +874,78 @@ class AssetManager:
         safe_alt = sanitize_filename(alt_text, fallback=f"image-{index:02d}")
         candidate = slug_dir / f"{index:02d}_{safe_alt}{ext}"
         suffix_counter = 1
-        while candidate.exists():
+        while candidate.exists() or candidate in self._reserved:
             candidate = slug_dir / f"{index:02d}_{safe_alt}_{suffix_counter}{ext}"
             suffix_counter += 1
+        self._reserved.add(candidate)
+        return candidate
 
-        try:
-            with client.stream("GET", remote_url, headers=BASE_HEADERS, timeout=30) as resp:
-                resp.raise_for_status()
-                with candidate.open("wb") as fh:
-                    for chunk in resp.iter_bytes():
-                        fh.write(chunk)
-        except httpx.HTTPError as exc:
-            return None, f"图片下载失败：{remote_url} -> {exc}"
-
-        slug_cache[remote_url] = candidate
+    async def _download(
+        self,
+        client: httpx.AsyncClient,
+        gate: RequestGate,
+        slug: str,
+        remote_url: str,
+        alt_text: str,
+        index: int,
+        max_retries: int = 3,
+    ) -> Tuple[Optional[Path], Optional[str]]:
+        """实际执行流式下载（本地已有副本时发条件请求），成功后写入清单。
+
+        遇到 429/503 时暂停该站点，并在下一次 gate.slot 等完暂停后重试，
+        最多尝试 max_retries 次；其他错误直接返回失败。
+        """
+
+        entry = self.manifest.get(remote_url, {})
+        headers: Dict[str, str] = {}
+        if entry.get("path"):
+            # 沿用清单中的文件名，重复运行不会生成 _1、_2 之类的新副本
+            candidate = self.base_dir / entry["path"]
+            candidate.parent.mkdir(parents=True, exist_ok=True)
+            self._reserved.add(candidate)
+            if candidate.is_file():
+                if entry.get("etag"):
+                    headers["If-None-Match"] = entry["etag"]
+                if entry.get("last_modified"):
+                    headers["If-Modified-Since"] = entry["last_modified"]
+        else:
+            candidate = self._reserve_path(slug, remote_url, alt_text, index)
+        # 先写入 .part 临时文件，完整下载后再原子改名，中断时不会留下半张图片
+        partial = candidate.with_name(candidate.name + ".part")
+        for attempt in range(1, max_retries + 1):
+            try:
+                # 图片走 CDN，不参与页面节流，只占用全局与单站点并发名额
+                async with gate.slot(remote_url, throttle=False):
+                    # 其余请求头、超时均沿用客户端默认值，连接从共享连接池中复用
+                    async with client.stream("GET", remote_url, headers=headers) as resp:
+                        if resp.status_code != 304:
+                            resp.raise_for_status()
+                            size, sha256 = await write_stream_to_file(resp, partial)
+                if resp.status_code != 304:
+                    os.replace(partial, candidate)
+                break
+            except httpx.HTTPError as exc:
+                partial.unlink(missing_ok=True)
+                throttled = (
+                    isinstance(exc, httpx.HTTPStatusError)
+                    and exc.response.status_code in THROTTLE_STATUS_CODES
+                )
+                if throttled:
+                    gate.backoff(remote_url, parse_retry_after(exc.response.headers.get("retry-after")))
+                if not throttled or attempt == max_retries:
+                    return None, f"图片下载失败：{remote_url} -> {exc} (尝试 {attempt}/{max_retries})"
+        gate.recover(remote_url)
+
+        if resp.status_code != 304:
+            self.manifest[remote_url] = {
+                "path": candidate.relative_to(self.base_dir).as_posix(),
+                "etag": resp.headers.get("etag"),
+                "last_modified": resp.headers.get("last-modified"),
+                "content_length": size,
+                "sha256": sha256,
+                "mirrors": entry.get("mirrors", {}),
+            }
+            self._refreshed.add(remote_url)
         return candidate, None
 
 
@@ -348,139 +962,186 @@ class StoryScraper:
         output_root: Path,
         asset_root: Path,
         sleep_seconds: float,
+        extractor: str = EXTRACTORS[0],
     ) -> None:
         self.output_root = output_root
         self.asset_root = asset_root
         self.sleep_seconds = sleep_seconds
+        self.extractor = extractor
         self.asset_manager = AssetManager(asset_root)
+        self.gate = RequestGate(MAX_CONCURRENT_REQUESTS, sleep_seconds)
+        # run() 期间创建的提取线程池；为 None 时退回事件循环的默认执行器
+        self._extract_pool: Optional[ThreadPoolExecutor] = None
 
-    def scrape_article(self, client: httpx.Client, url: str) -> List[DownloadResult]:
+    async def scrape_article(self, client: httpx.AsyncClient, url: str) -> List[DownloadResult]:
         """抓取单篇英文页面，并尝试下载可用的多语言版本。"""
 
         slug = derive_slug(url)
-        results: List[DownloadResult] = []
 
         # 先抓英文原文
-        en_html, en_warnings = fetch_html(client, url, "en", sleep_seconds=self.sleep_seconds)
-        if not en_html:
+        en_response, en_warnings = await fetch_html(
+            client, self.gate, url, "en", sleep_seconds=self.sleep_seconds
+        )
+        if en_response is None:
             print(f"[x] 无法获取英文原文：{url}")
             return []
+        en_html = en_response.text
 
-        # 解析 HTML 一次即可复用节点树
-        en_tree = parse_html_tree(en_html)
-        variants = extract_language_variants(en_tree, url)
+        # 优先读响应头 Link 中的多语言链接；未提供时才扫描页面头部，
+        # 整页解析留给英文正文任务
+        variants = extract_link_header_variants(en_response.headers, url)
+        if not any(lang in variants for lang in ZH_HREFLANGS):
+            variants = extract_language_variants(parse_head(en_html), url, stop_at=ZH_HREFLANGS)
 
-        # 组织需要抓取的语言：英文永远保留，中文若可用则追加
-        language_plan: List[Tuple[str, str, Optional[lxml_html.HtmlElement], Optional[str], List[str]]]
-        language_plan = [("en", url, en_tree, en_html, en_warnings)]
+        # 组织需要抓取的语言：英文永远保留，中文若可用则追加；各语言并发处理
+        jobs = [self.scrape_language(client, slug, "en", url, en_html, en_warnings)]
 
-        zh_url = variants.get("zh") or variants.get("zh-cn") or variants.get("zh-hans")
+        zh_url = next((variants[lang] for lang in ZH_HREFLANGS if lang in variants), None)
         if zh_url:
-            language_plan.append(("zh-Hans", zh_url, None, None, []))
+            jobs.append(self.scrape_language(client, slug, "zh-Hans", zh_url, None, []))
+
+        return list(await asyncio.gather(*jobs))
 
-        for lang_code, lang_url, cached_tree, cached_html, warnings in language_plan:
-            if cached_html is None:
-                html_text, new_warnings = fetch_html(
-                    client, lang_url, lang_code, sleep_seconds=self.sleep_seconds
+    async def scrape_language(
+        self,
+        client: httpx.AsyncClient,
+        slug: str,
+        lang_code: str,
+        lang_url: str,
+        cached_html: Optional[str],
+        warnings: List[str],
+    ) -> DownloadResult:
+        """处理单个语言版本：必要时抓取页面，下载图片并写入 Markdown。"""
+
+        markdown_dir = self.output_root / slug
+        markdown_dir.mkdir(parents=True, exist_ok=True)
+
+        if cached_html is None:
+            response, new_warnings = await fetch_html(
+                client, self.gate, lang_url, lang_code, sleep_seconds=self.sleep_seconds
+            )
+            warnings.extend(new_warnings)
+            cached_html = response.text if response is not None else None
+            if not cached_html:
+                warnings.append(f"多语言页面不可用：{lang_code} -> {lang_url}")
+                return DownloadResult(
+                    meta=ArticleMeta(
+                        title="抓取失败",
+                        author="",
+                        published="",
+                        source_url=lang_url,
+                        language=lang_code,
+                    ),
+                    markdown_path=markdown_dir / f"{lang_code}.md",
+                    assets=[],
+                    warnings=warnings,
                 )
-                warnings.extend(new_warnings)
-                if not html_text:
-                    warnings.append(f"多语言页面不可用：{lang_code} -> {lang_url}")
-                    markdown_dir = self.output_root / slug
-                    markdown_dir.mkdir(parents=True, exist_ok=True)
-                    expected_path = markdown_dir / f"{lang_code}.md"
-                    results.append(
-                        DownloadResult(
-                            meta=ArticleMeta(
-                                title="抓取失败",
-                                author="",
-                                published="",
-                                source_url=lang_url,
-                                language=lang_code,
-                            ),
-                            markdown_path=expected_path,
-                            assets=[],
-                            warnings=warnings,
-                        )
-                    )
-                    continue
-                cached_html = html_text
-                cached_tree = parse_html_tree(html_text)
-
-            assert cached_tree is not None
-            assert cached_html is not None
-
-            meta = extract_article_meta(cached_tree, lang_code, lang_url)
-            markdown = html_to_markdown(cached_html, lang_url)
-
-            # 图片收集与下载
-            images = collect_images(cached_tree, lang_url)
-            replacement_map: Dict[str, str] = {}
-            assets: List[Path] = []
-            markdown_dir = self.output_root / slug
-            markdown_dir.mkdir(parents=True, exist_ok=True)
-
-            for idx, (img_url, alt) in enumerate(images, start=1):
-                local_path, warn = self.asset_manager.ensure_download(
+
+        # 每个页面只整页解析一次，元信息、正文与图片提取共用这棵树
+        # 解析与正文提取是 CPU 密集步骤，放到线程池执行，事件循环继续处理下载
+        loop = asyncio.get_running_loop()
+        tree = await loop.run_in_executor(self._extract_pool, parse_html_tree, cached_html)
+
+        meta = extract_article_meta(tree, lang_code, lang_url)
+
+        # 图片收集与下载：同一篇文章的所有图片并发请求，单张异常不影响其余图片
+        images = collect_images(tree, lang_url)
+        downloads = await asyncio.gather(
+            *(
+                self.asset_manager.ensure_download(
                     client,
+                    self.gate,
                     slug,
                     img_url,
                     alt,
                     index=idx,
                 )
-                if warn:
-                    warnings.append(warn)
-                    continue
-                if local_path is None:
-                    continue
-                assets.append(local_path)
-                relative_path = Path(os.path.relpath(local_path, markdown_dir))
-                replacement_map[img_url] = relative_path.as_posix()
-
-            markdown = rewrite_markdown_images(markdown, replacement_map)
-
-            # 写入 Markdown 文件，包含 Front Matter 与提示语
-            markdown_path = markdown_dir / f"{lang_code}.md"
-            front_matter = [
-                "---",
-                f'title: "{meta.title}"',
-                f"author: {meta.author}",
-                f"published: {meta.published}",
-                f"source: {meta.source_url}",
-                f"language: {meta.language}",
-                "tags: [Strixhaven, Magic Story]",
-                "---",
-                "",
-                "_注：非盈利同人整理，遵循威世智粉丝内容政策，仅供教学与跑团使用。_",
-                "",
-            ]
-            markdown_path.write_text("\n".join(front_matter) + markdown, encoding="utf-8")
-
-            result = DownloadResult(
-                meta=meta,
-                markdown_path=markdown_path,
-                assets=assets,
-                warnings=warnings,
-            )
-            results.append(result)
+                for idx, (img_url, alt) in enumerate(images, start=1)
+            ),
+            return_exceptions=True,
+        )
 
-        return results
+        replacement_map: Dict[str, str] = {}
+        assets: List[Path] = []
+        # AssetManager 保证图片都落在 assets/<slug>/ 下，相对前缀每个语言只算一次
+        rel_prefix = Path(os.path.relpath(self.asset_manager.base_dir / slug, markdown_dir))
+        for (img_url, _alt), outcome in zip(images, downloads):
+            if isinstance(outcome, BaseException):
+                warnings.append(f"图片下载失败：{img_url} -> {outcome}")
+                continue
+            local_path, warn = outcome
+            if warn:
+                warnings.append(warn)
+                continue
+            if local_path is None:
+                continue
+            assets.append(local_path)
+            relative_path = rel_prefix / local_path.name
+            replacement_map[img_url] = relative_path.as_posix()
+
+        # 图片地址已在节点树上改写为本地路径，提取结果无需再做文本替换
+        localize_images(tree, lang_url, replacement_map)
+        markdown = await loop.run_in_executor(
+            self._extract_pool, html_to_markdown, tree, self.extractor
+        )
+
+        # 写入 Markdown 文件，包含 Front Matter 与提示语
+        markdown_path = markdown_dir / f"{lang_code}.md"
+        front_matter = [
+            "---",
+            f'title: "{meta.title}"',
+            f"author: {meta.author}",
+            f"published: {meta.published}",
+            f"source: {meta.source_url}",
+            f"language: {meta.language}",
+            "tags: [Strixhaven, Magic Story]",
+            "---",
+            "",
+            "_注：非盈利同人整理，遵循威世智粉丝内容政策，仅供教学与跑团使用。_",
+            "",
+        ]
+        # Front Matter 与正文分两次写入同一缓冲文件，避免为拼接整篇正文再复制一份字符串
+        with markdown_path.open("w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as fh:
+            fh.write("\n".join(front_matter))
+            fh.write(markdown)
+
+        return DownloadResult(
+            meta=meta,
+            markdown_path=markdown_path,
+            assets=assets,
+            warnings=warnings,
+        )
 
-    def run(self, limit: Optional[int] = None) -> List[DownloadResult]:
-        """遍历目标文章列表并收集所有抓取结果。"""
+    async def run(self, limit: Optional[int] = None) -> List[DownloadResult]:
+        """并发处理目标文章列表并收集所有抓取结果（保持原列表顺序）。"""
 
         all_results: List[DownloadResult] = []
         self.output_root.mkdir(parents=True, exist_ok=True)
         self.asset_root.mkdir(parents=True, exist_ok=True)
 
-        with httpx.Client(follow_redirects=True) as client:
-            for idx, url in enumerate(TARGET_ARTICLES, start=1):
-                if limit is not None and idx > limit:
-                    break
-                print(f"[>] ({idx}/{len(TARGET_ARTICLES)}) 处理 {url}")
-                results = self.scrape_article(client, url)
-                all_results.extend(results)
-                time.sleep(self.sleep_seconds)
+        self._extract_pool = ThreadPoolExecutor(max_workers=MAX_EXTRACT_WORKERS)
+        try:
+            async with build_client() as client:
+                # 后台预热图片 CDN 连接：页面抓取与解析期间完成握手，不占用关键路径
+                warmup = asyncio.ensure_future(warm_up_connections(client))
+                try:
+                    jobs = []
+                    for idx, url in enumerate(TARGET_ARTICLES, start=1):
+                        if limit is not None and idx > limit:
+                            break
+                        print(f"[>] ({idx}/{len(TARGET_ARTICLES)}) 处理 {url}")
+                        jobs.append(self.scrape_article(client, url))
+                    for results in await asyncio.gather(*jobs):
+                        all_results.extend(results)
+                finally:
+                    # 客户端关闭前结束预热任务，避免其在已关闭的连接池上继续运行
+                    warmup.cancel()
+                    await asyncio.gather(warmup, return_exceptions=True)
+        finally:
+            self._extract_pool.shutdown(wait=True)
+            self._extract_pool = None
+            # 中途出错也保存已完成的下载记录，下次运行可直接复用
+            self.asset_manager.save_manifest()
         return all_results
 
 
@@ -511,7 +1172,7 @@ def parse_args() -> argparse.Namespace:
         "--sleep",
         type=float,
         default=1.0,
-        help="每次请求后的等待秒数，帮助避开限速。",
+        help="同一站点相邻页面请求的最小间隔秒数，帮助避开限速。",
     )
     parser.add_argument(
         "--limit",
@@ -519,6 +1180,12 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="可选：仅抓取前 N 篇，便于调试。",
     )
+    parser.add_argument(
+        "--extractor",
+        choices=EXTRACTORS,
+        default=EXTRACTORS[0],
+        help="首选正文提取引擎；未安装或提取为空时自动回退到其他引擎。",
+    )
     return parser.parse_args()
 
 
@@ -526,8 +1193,8 @@ def main() -> None:
     """程序主入口：初始化抓取器并输出执行摘要。"""
 
     args = parse_args()
-    scraper = StoryScraper(args.output, args.assets, args.sleep)
-    results = scraper.run(limit=args.limit)
+    scraper = StoryScraper(args.output, args.assets, args.sleep, args.extractor)
+    results = asyncio.run(scraper.run(limit=args.limit))
 
     print("\n[summary] 抓取完成，结果概览：")
     for item in results:
@@ -16,6 +16,7 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 from pathlib import Path
 
 from wotc_story_scraper import StoryScraper, TARGET_ARTICLES
@@ -41,7 +42,7 @@ def parse_args() -> argparse.Namespace:
         "--sleep",
         type=float,
         default=0.5,
-        help="请求后的等待秒数，默认 0.5s 便于快速体验",
+        help="同一站点页面请求间隔秒数，默认 0.5s 便于快速体验",
     )
     return parser.parse_args()
 
@@ -54,7 +55,7 @@ def main() -> None:
     # 仅抓取第一条，演示返回结构
     first_url = TARGET_ARTICLES[0]
     print(f"[demo] 抓取示例地址：{first_url}")
-    results = scraper.run(limit=1)
+    results = asyncio.run(scraper.run(limit=1))
     for item in results:
         status = "OK" if item.markdown_path.is_file() else "FAIL"
         markdown_display = (